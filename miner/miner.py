@@ -135,11 +135,13 @@ class SN98Miner:
 
             # Allocate all available inventory
             # Note: validator will calculate actual amounts used based on price
-            new_pos = Position(
+            # Ticks are snapped ints with lower < upper and the allocations come
+            # from the already-validated synapse, so skip re-validation.
+            new_pos = Position.model_construct(
                 tick_lower=lower_tick,
                 tick_upper=upper_tick,
-                allocation0=synapse.inventory_remaining["amount0"],
-                allocation1=synapse.inventory_remaining["amount1"],
+                allocation0=synapse.inventory_remaining.amount0,
+                allocation1=synapse.inventory_remaining.amount1,
             )
 
             synapse.desired_positions = [new_pos]
@@ -19,22 +19,30 @@ from protocol.models import (
     PerformanceMetrics,
 )
 
-# Export synapses (optional import - requires bittensor)
-try:
-    from protocol.synapses import (
-        StrategyRequest,
-        RebalanceQuery,
-        MinerMetadata,
-    )
-
-    _SYNAPSES_AVAILABLE = True
-except ImportError:
-    # Bittensor not available - synapses won't be available
-    # but core models will still work for testing
-    StrategyRequest = None
-    RebalanceQuery = None
-    MinerMetadata = None
-    _SYNAPSES_AVAILABLE = False
+# Export synapses lazily (requires bittensor). Importing bittensor is slow, so
+# code that only needs the shared models above should not pay for it.
+_SYNAPSE_EXPORTS = ("StrategyRequest", "RebalanceQuery", "MinerMetadata")
+
+
+def __getattr__(name):
+    if name not in _SYNAPSE_EXPORTS and name != "_SYNAPSES_AVAILABLE":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        from protocol import synapses
+
+        available = True
+    except ImportError:
+        # Bittensor not available - synapses won't be available
+        # but core models will still work for testing
+        synapses = None
+        available = False
+
+    globals()["_SYNAPSES_AVAILABLE"] = available
+    for export in _SYNAPSE_EXPORTS:
+        globals()[export] = getattr(synapses, export, None)
+    return globals()[name]
+
 
 __all__ = [
     # Shared Models
@@ -6,7 +6,7 @@ validators and miners. Validator-specific and miner-specific models
 have been moved to their respective modules.
 """
 from typing import List, Optional
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 from enum import Enum
 
 
@@ -20,6 +20,8 @@ class Mode(str, Enum):
 class Inventory(BaseModel):
     """Inventory of tokens available for deployment."""
 
+    model_config = ConfigDict(frozen=True)
+
     amount0: str = Field(..., description="Amount of token0 in wei")
     amount1: str = Field(..., description="Amount of token1 in wei")
 
@@ -35,6 +37,8 @@ class CurrentPosition(BaseModel):
 class Position(BaseModel):
     """A single v3 LP position."""
 
+    model_config = ConfigDict(frozen=True)
+
     tick_lower: int = Field(..., description="Lower tick bound")
     tick_upper: int = Field(..., description="Upper tick bound")
     allocation0: str = Field(..., description="Amount of token0 to allocate")
@@ -7,14 +7,16 @@ The subnet uses a rebalance-only approach:
 """
 from typing import List, Optional
 import bittensor as bt
-from pydantic import Field, BaseModel
+from pydantic import ConfigDict, Field, BaseModel
 
-from protocol.models import Position
+from protocol.models import Inventory, Position
 
 
 class MinerMetadata(BaseModel):
     """Metadata about the miner's model."""
 
+    model_config = ConfigDict(frozen=True)
+
     version: str = Field(..., description="Miner version")
     model_info: str = Field(..., description="Model description")
 
@@ -63,7 +65,7 @@ class RebalanceQuery(bt.Synapse):
     block_number: int = Field(..., description="Current block number in simulation")
     current_price: float = Field(..., description="Current price (token1/token0)")
     current_positions: List[Position] = Field(..., description="Current LP positions")
-    inventory_remaining: Optional[dict] = Field(
+    inventory_remaining: Optional[Inventory] = Field(
         None, description="Available tokens (amount0, amount1)"
     )
     rebalances_so_far: int = Field(
@@ -6,11 +6,18 @@ Use these from conftest.py fixtures, unittest setUp, or individual tests.
 from __future__ import annotations
 
 import asyncio
+import itertools
 import os
 import subprocess
 import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Tuple
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
 
 # Ensure project root is on path when tests run
 def _ensure_project_root() -> Path:
@@ -26,9 +33,15 @@ def ensure_project_root() -> Path:
 
 
 def get_test_wallets_path() -> str:
-    """Default wallet directory for tests (under project root)."""
+    """
+    Default wallet directory for tests (under project root).
+
+    Under pytest-xdist each worker gets its own subdirectory (wallets/gw0, ...),
+    so workers generating keys at the same time never overwrite each other's.
+    """
     root = ensure_project_root()
-    return str(root / "wallets")
+    worker = os.environ.get("PYTEST_XDIST_WORKER")
+    return str(root / "wallets" / worker) if worker else str(root / "wallets")
 
 
 def create_test_wallets(
@@ -51,38 +64,145 @@ def create_test_wallets(
     os.makedirs(path, exist_ok=True)
 
     val = bt.Wallet(name=validator_name, hotkey=validator_hotkey, path=path)
-    val.create_if_non_existent(coldkey_use_password=False, hotkey_use_password=False)
+    _ensure_wallet_keys(val)
 
     miner = bt.Wallet(name=miner_name, hotkey=miner_hotkey, path=path)
-    miner.create_if_non_existent(coldkey_use_password=False, hotkey_use_password=False)
+    _ensure_wallet_keys(miner)
 
     return (val, miner)
 
 
+def _ensure_wallet_keys(wallet) -> None:
+    """Generate the wallet's keys unless they are already on disk."""
+    if (
+        wallet.coldkey_file.exists_on_device()
+        and wallet.coldkeypub_file.exists_on_device()
+        and wallet.hotkey_file.exists_on_device()
+    ):
+        return
+    wallet.create_if_non_existent(coldkey_use_password=False, hotkey_use_password=False)
+
+
+# Seeded from the wall clock so ids stay unique across runs against a persistent DB.
+_job_seq = itertools.count(time.time_ns())
+
+
+def unique_job_id(prefix: str) -> str:
+    """Job id that is unique within and across test runs, e.g. ``test_job_<n>``."""
+    return f"{prefix}_{next(_job_seq)}"
+
+
+_postgres_schemas_ready = False
+# Arbitrary key for the advisory lock that serializes schema creation
+_SCHEMA_LOCK_ID = 98
+
+
+async def init_postgres_db() -> None:
+    """
+    Connect Tortoise to the jobs Postgres DB (JOBS_POSTGRES_* env).
+
+    Schemas are generated on the first call only; the tables persist in
+    Postgres, so later connects in the same process skip the DDL. The DDL runs
+    under a transaction-scoped advisory lock, so parallel pytest-xdist workers
+    create the tables one at a time instead of racing on CREATE TABLE.
+    """
+    global _postgres_schemas_ready
+    from tortoise import Tortoise
+    from tortoise.transactions import in_transaction
+    from tortoise.utils import generate_schema_for_client
+    from validator.utils.env import (
+        JOBS_POSTGRES_DB,
+        JOBS_POSTGRES_HOST,
+        JOBS_POSTGRES_PASSWORD,
+        JOBS_POSTGRES_PORT,
+        JOBS_POSTGRES_USER,
+    )
+
+    db_url = (
+        f"postgres://{JOBS_POSTGRES_USER}:{JOBS_POSTGRES_PASSWORD}@"
+        f"{JOBS_POSTGRES_HOST}:{JOBS_POSTGRES_PORT}/{JOBS_POSTGRES_DB}"
+    )
+    await Tortoise.init(
+        db_url=db_url,
+        modules={"models": ["validator.models.job", "validator.models.pool_events"]},
+    )
+    if not _postgres_schemas_ready:
+        async with in_transaction("default") as conn:
+            await conn.execute_query("SELECT pg_advisory_xact_lock($1)", [_SCHEMA_LOCK_ID])
+            await generate_schema_for_client(conn, safe=True)
+        _postgres_schemas_ready = True
+
+
+@dataclass(slots=True)
+class FakeMetagraph:
+    """Plain stand-in for bt.Metagraph exposing only the fields the validator reads."""
+
+    S: np.ndarray
+    uids: List[int]
+    hotkeys: List[str]
+    axons: List[object]
+
+
+@lru_cache(maxsize=16)
+def _make_axon(ip: str, port: int, hotkey: str, coldkey: str) -> object:
+    """Build (once per distinct endpoint) the AxonInfo for a test miner."""
+    import bittensor as bt
+
+    return bt.AxonInfo(
+        version=1,
+        ip=ip,
+        port=port,
+        ip_type=4,
+        hotkey=hotkey,
+        coldkey=coldkey,
+    )
+
+
 def build_mock_metagraph_for_miner(
     miner_wallet: object,
     ip: str = "127.0.0.1",
     port: int = 8092,
-) -> object:
-    """Build a MagicMock Metagraph with a single miner axon (for full-flow style tests)."""
-    from unittest.mock import MagicMock
-    import bittensor as bt
+) -> FakeMetagraph:
+    """Build a fake Metagraph with a single miner axon (for full-flow style tests)."""
+    hotkey = miner_wallet.hotkey.ss58_address
+    return FakeMetagraph(
+        S=np.array([1.0], dtype=np.float32),
+        uids=[0],
+        hotkeys=[hotkey],
+        axons=[_make_axon(ip, port, hotkey, miner_wallet.coldkeypub.ss58_address)],
+    )
 
-    m = MagicMock(spec=bt.Metagraph)
-    m.S = [1.0]
-    m.uids = [0]
-    m.hotkeys = [miner_wallet.hotkey.ss58_address]
-    m.axons = [
-        bt.AxonInfo(
-            version=1,
-            ip=ip,
-            port=port,
-            ip_type=4,
-            hotkey=miner_wallet.hotkey.ss58_address,
-            coldkey=miner_wallet.coldkeypub.ss58_address,
-        )
-    ]
-    return m
+
+async def wait_for_port(
+    host: str,
+    port: int,
+    timeout: float,
+    *,
+    connect_timeout: float = 0.2,
+    poll_interval: float = 0.05,
+    give_up: Optional[Callable[[], bool]] = None,
+) -> bool:
+    """
+    Poll until a TCP connect to host:port succeeds or timeout elapses.
+
+    give_up is checked between attempts; returning True stops polling early
+    (e.g. when the process that should open the port has already exited).
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.wait_for(
+                asyncio.open_connection(host, port), timeout=connect_timeout
+            )
+        except (OSError, asyncio.TimeoutError):
+            if loop.time() >= deadline or (give_up is not None and give_up()):
+                return False
+            await asyncio.sleep(poll_interval)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return True
 
 
 async def start_miner_process(
@@ -91,8 +211,19 @@ async def start_miner_process(
     miner_name: str = "test_miner",
     miner_hotkey: str = "test_hotkey",
     wait_seconds: float = 5.0,
+    host: str = "127.0.0.1",
 ) -> subprocess.Popen:
-    """Start miner subprocess. Wait wait_seconds for startup. Caller must terminate."""
+    """
+    Start miner subprocess. Caller must terminate.
+
+    Returns as soon as the miner axon accepts TCP connections on host:port;
+    wait_seconds is only the upper bound on how long to wait for that. If the
+    port never opens the miner is stopped and RuntimeError (it exited) or
+    TimeoutError (it hung) is raised with the tail of its log.
+    Miner output goes to a temp log file (proc.log_path) rather than a pipe,
+    so a chatty miner can never block on a full pipe buffer nobody reads;
+    the caller removes that file once the miner is stopped.
+    """
     root = ensure_project_root()
     env = os.environ.copy()
     env["AXON_PORT"] = str(port)
@@ -104,12 +235,34 @@ async def start_miner_process(
         "--axon.port", str(port),
         "--subtensor.network", "test",
     ]
-    proc = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        env=env,
-        cwd=str(root),
+    log_fd, log_path = tempfile.mkstemp(prefix=f"{miner_name}_", suffix=".log")
+    with os.fdopen(log_fd, "wb") as log_file:
+        proc = subprocess.Popen(
+            cmd,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            env=env,
+            cwd=str(root),
+        )
+    proc.log_path = log_path
+    ready = await wait_for_port(
+        host, port, wait_seconds, give_up=lambda: proc.poll() is not None
+    )
+    if ready:
+        return proc
+
+    # Startup failed: stop the miner if it is still up, then surface its output
+    exited = proc.poll() is not None
+    if not exited:
+        proc.kill()
+        proc.wait()
+    log_tail = Path(log_path).read_bytes().decode(errors="replace")[-2000:]
+    Path(log_path).unlink(missing_ok=True)
+    if exited:
+        raise RuntimeError(
+            f"Miner exited with code {proc.returncode} before listening on "
+            f"{host}:{port}:\n{log_tail}"
+        )
+    raise TimeoutError(
+        f"Miner did not listen on {host}:{port} within {wait_seconds}s:\n{log_tail}"
     )
-    await asyncio.sleep(wait_seconds)
-    return proc
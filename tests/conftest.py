@@ -7,8 +7,12 @@ from __future__ import annotations
 
 import logging
 import os
+import subprocess
+from pathlib import Path
 
 import pytest
+import pytest_asyncio
+from tortoise import Tortoise
 
 # Ensure project root on path before any local imports
 from tests.common import (
@@ -21,13 +25,72 @@ from tests.common import (
 
 ensure_project_root()
 
+from validator.models.job import (
+    Job,
+    LiveExecution,
+    MinerParticipation,
+    MinerScore,
+    Prediction,
+    Round,
+)
+
 logger = logging.getLogger(__name__)
 
-# Defaults for full-flow–style tests
-MINER_PORT = 8092
+# Defaults for full-flow–style tests. Under pytest-xdist each worker (gw0, gw1, ...)
+# gets its own miner port so parallel sessions don't collide.
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+MINER_PORT = 8092 + int(_XDIST_WORKER[2:] or 0)
 MINER_IP = "127.0.0.1"
 
 
+# Own connection name: Tortoise caches compiled INSERTs per connection name,
+# and the Postgres-backed modules in this session use "default".
+SQLITE_CONNECTION = "sqlite_test"
+
+
+async def _init_sqlite_db() -> None:
+    """Point the (process-global) Tortoise models at a fresh in-memory SQLite DB."""
+    await Tortoise.init(
+        config={
+            "connections": {SQLITE_CONNECTION: "sqlite://:memory:"},
+            "apps": {
+                "models": {
+                    "models": ["validator.models.job"],
+                    "default_connection": SQLITE_CONNECTION,
+                }
+            },
+        }
+    )
+    await Tortoise.generate_schemas(safe=True)
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def tortoise_db():
+    """
+    In-memory SQLite Tortoise DB, initialized once per session.
+    Tests using it must run on the session loop (loop_scope="session").
+    """
+    await _init_sqlite_db()
+    try:
+        yield
+    finally:
+        await Tortoise.close_connections()
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def clean_db(tortoise_db):
+    """Empty all job tables before the test (shared session DB)."""
+    # Tortoise state is process-global. If a Postgres-backed module (init_postgres_db)
+    # ran since the last test, the models now point at "default" and the SQLite DB
+    # is gone. Reconnect instead of deleting every row from Postgres.
+    if Job._meta.default_connection != SQLITE_CONNECTION:
+        await _init_sqlite_db()
+    for model in (LiveExecution, Prediction, MinerParticipation, MinerScore, Round, Job):
+        assert model._meta.default_connection == SQLITE_CONNECTION, model.__name__
+        await model.all().delete()
+    yield
+
+
 @pytest.fixture(scope="session")
 def test_wallets_path() -> str:
     """Wallet directory for tests. Same path used by miner subprocess in full-flow."""
@@ -36,18 +99,22 @@ def test_wallets_path() -> str:
     return path
 
 
-@pytest.fixture
-def validator_wallet(test_wallets_path: str):
-    """Create validator test wallet. Reused across tests using same path."""
-    val, _ = create_test_wallets(test_wallets_path)
-    return val
+@pytest.fixture(scope="session")
+def test_wallets(test_wallets_path: str):
+    """(validator_wallet, miner_wallet), created once per session."""
+    return create_test_wallets(test_wallets_path)
 
 
-@pytest.fixture
-def miner_wallet(test_wallets_path: str):
-    """Create miner test wallet. Reused across tests using same path."""
-    _, miner = create_test_wallets(test_wallets_path)
-    return miner
+@pytest.fixture(scope="session")
+def validator_wallet(test_wallets):
+    """Validator test wallet. Reused across tests using same path."""
+    return test_wallets[0]
+
+
+@pytest.fixture(scope="session")
+def miner_wallet(test_wallets):
+    """Miner test wallet. Reused across tests using same path."""
+    return test_wallets[1]
 
 
 @pytest.fixture
@@ -56,10 +123,10 @@ def mock_metagraph_with_miner(miner_wallet):
     return build_mock_metagraph_for_miner(miner_wallet, ip=MINER_IP, port=MINER_PORT)
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def miner_process(miner_wallet, test_wallets_path: str):
     """
-    Start miner subprocess; yield for test; terminate on teardown.
+    Start miner subprocess once per session; terminate at session teardown.
     Use in tests that need a live miner (e.g. full flow).
     """
     proc = await start_miner_process(
@@ -68,6 +135,7 @@ async def miner_process(miner_wallet, test_wallets_path: str):
         miner_name="test_miner",
         miner_hotkey="test_hotkey",
         wait_seconds=5.0,
+        host=MINER_IP,
     )
     try:
         yield proc
@@ -75,4 +143,10 @@ async def miner_process(miner_wallet, test_wallets_path: str):
         if proc.poll() is None:
             logger.info("Stopping miner subprocess...")
             proc.terminate()
-            proc.wait(timeout=10)
+            try:
+                proc.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                logger.warning("Miner did not exit after SIGTERM; killing it")
+                proc.kill()
+                proc.wait()
+        Path(proc.log_path).unlink(missing_ok=True)
@@ -0,0 +1,138 @@
+"""
+Tests for validator.utils.cache.async_ttl_cache.
+"""
+import asyncio
+
+import pytest
+
+from validator.utils import cache
+from validator.utils.cache import async_ttl_cache
+
+
+class _Backend:
+    """Counts calls; each call blocks until ``release`` is set."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.fail = False
+
+    async def fetch(self, key):
+        self.calls += 1
+        await self.release.wait()
+        if self.fail:
+            raise RuntimeError("backend down")
+        return f"{key}-{self.calls}"
+
+
+class _Clock:
+    """Stand-in for cache.time with a manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(cache, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def backend():
+    backend = _Backend()
+    backend.cached = async_ttl_cache(ttl=60)(backend.fetch)
+    return backend
+
+
+async def test_concurrent_misses_share_one_call(backend):
+    callers = [asyncio.create_task(backend.cached("a")) for _ in range(5)]
+    await asyncio.sleep(0)
+    backend.release.set()
+
+    results = await asyncio.gather(*callers)
+
+    assert results == ["a-1"] * 5
+    assert backend.calls == 1
+    # Later calls are served from the cache
+    assert await backend.cached("a") == "a-1"
+    assert backend.calls == 1
+
+
+async def test_different_keys_are_not_coalesced(backend):
+    backend.release.set()
+
+    assert await asyncio.gather(backend.cached("a"), backend.cached("b")) == ["a-1", "b-2"]
+    assert backend.calls == 2
+
+
+async def test_failure_is_propagated_and_not_cached(backend):
+    backend.fail = True
+    backend.release.set()
+    callers = [asyncio.create_task(backend.cached("a")) for _ in range(3)]
+
+    results = await asyncio.gather(*callers, return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert backend.calls == 1
+
+    backend.fail = False
+    assert await backend.cached("a") == "a-2"
+    assert backend.calls == 2
+
+
+async def test_cancelled_caller_does_not_cancel_shared_call(backend):
+    first = asyncio.create_task(backend.cached("a"))
+    second = asyncio.create_task(backend.cached("a"))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    await asyncio.sleep(0)
+    backend.release.set()
+
+    assert await second == "a-1"
+    assert first.cancelled()
+    assert backend.calls == 1
+    assert await backend.cached("a") == "a-1"
+
+
+async def test_cache_clear_during_call_does_not_store_stale_result(backend):
+    stale = asyncio.create_task(backend.cached("a"))
+    await asyncio.sleep(0)
+
+    backend.cached.cache_clear()
+    backend.release.set()
+
+    assert await stale == "a-1"
+    # The call that started before cache_clear must not repopulate the cache
+    assert await backend.cached("a") == "a-2"
+    assert backend.calls == 2
+
+
+async def test_hit_within_ttl_and_refetch_after(backend, clock):
+    backend.release.set()
+
+    assert await backend.cached("a") == "a-1"
+    clock.now += 59
+    assert await backend.cached("a") == "a-1"
+    assert backend.calls == 1
+
+    clock.now += 1
+    assert await backend.cached("a") == "a-2"
+    assert backend.calls == 2
+
+
+async def test_expired_entries_are_evicted_on_insert(backend, clock):
+    backend.release.set()
+    for block in range(100):
+        await backend.cached(block)
+    assert backend.cached.cache_len() == 100
+
+    clock.now += 60
+    await backend.cached("fresh")
+
+    assert backend.cached.cache_len() == 1
@@ -0,0 +1,86 @@
+"""
+Tests for EmissionsService.calculate_weights.
+
+The burn/miner split is stubbed, so these pin the weight distribution itself:
+burn to UID 0, the miner share split by score among metagraph uids, and the
+final normalization.
+"""
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from validator.services.emissions import EmissionsService
+
+
+def _service(uids, burn_ratio, miner_ratio):
+    metagraph = MagicMock()
+    metagraph.uids = np.array(uids)
+    service = EmissionsService(
+        metagraph=metagraph,
+        subtensor=MagicMock(),
+        job_repository=MagicMock(),
+        netuid=98,
+    )
+    service.calculate_emissions_split = AsyncMock(return_value=(burn_ratio, miner_ratio))
+    return service
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "uids, split, scores, expected",
+    [
+        pytest.param(
+            # uid 9 is not in the metagraph but still counts toward the score
+            # total; uid 0's score is ignored (reserved for burn)
+            [0, 1, 2, 3, 5], (0.4, 0.6), {1: 0.5, 2: 1.5, 9: 2.0, 0: 3.0},
+            [0.4 / 0.7, 0.075 / 0.7, 0.225 / 0.7, 0.0, 0.0],
+            id="uid_missing_from_metagraph",
+        ),
+        pytest.param(
+            [0, 1, 2], (0.4, 0.6), {1: 0.0, 2: 0.0},
+            [1.0, 0.0, 0.0],
+            id="all_zero_scores_burn",
+        ),
+        pytest.param(
+            [0, 1, 2, 3, 5], (0.25, 0.75), {2: 5.0},
+            [0.25, 0.0, 0.75, 0.0, 0.0],
+            id="single_miner",
+        ),
+        pytest.param(
+            [0, 1, 2], (0.3, 0.7), {1: 1.0, 2: 3.0},
+            [0.3, 0.175, 0.525],
+            id="proportional_split",
+        ),
+        pytest.param(
+            [0, 1, 2], (0.4, 0.6), {},
+            [1.0, 0.0, 0.0],
+            id="no_scores_burn",
+        ),
+        pytest.param(
+            [0, 1], (1.0, 0.0), {1: 2.0},
+            [1.0, 0.0],
+            id="unprofitable_full_burn",
+        ),
+        pytest.param(
+            [1, 2], (0.4, 0.6), {1: 0.0},
+            [0.0, 0.0],
+            id="no_uid0_and_zero_scores",
+        ),
+        pytest.param(
+            [1, 2], (0.4, 0.6), {1: 1.0, 2: 1.0},
+            [0.5, 0.5],
+            id="no_uid0_renormalizes_miners",
+        ),
+    ],
+)
+async def test_calculate_weights(uids, split, scores, expected):
+    service = _service(uids, *split)
+
+    out_uids, weights = await service.calculate_weights(scores)
+
+    assert out_uids == uids
+    assert weights == pytest.approx(expected, abs=1e-12)
+    assert all(type(w) is float for w in weights)
+    if any(expected):
+        assert sum(weights) == pytest.approx(1.0, abs=1e-12)
@@ -3,48 +3,43 @@ Full-flow test: miner + validator orchestration with mocked chain/pool.
 
 Uses shared fixtures from conftest (wallets, mock metagraph, miner process)
 and a class-based layout with setup via fixtures.
+
+test_full_flow talks to a real miner subprocess over the axon (slow);
+test_full_flow_mocked_dendrite runs the same round against a canned dendrite.
 """
 from __future__ import annotations
 
+import contextlib
 import logging
 import unittest.mock as mock
 from datetime import datetime, timedelta, timezone
 
+import numpy as np
 import pytest
-from tortoise import Tortoise
+import pytest_asyncio
 import bittensor as bt
-from protocol import Inventory
-from validator.models.job import Job, Prediction, Round
+from protocol import Inventory, Position
+from validator.models.job import Job, Round
 from validator.repositories.job import JobRepository
 from validator.round_orchestrator import AsyncRoundOrchestrator
 
-from tests.common import ensure_project_root
+from tests.common import FakeMetagraph, ensure_project_root
 
 ensure_project_root()
 
 logger = logging.getLogger(__name__)
 
 
-@pytest.fixture
-async def full_flow_env(
-    validator_wallet,
-    miner_wallet,
-    mock_metagraph_with_miner,
-    miner_process,
-):
+# The shared session DB (conftest.tortoise_db) lives on the session loop.
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+@contextlib.asynccontextmanager
+async def _orchestrator_env(dendrite, metagraph):
     """
-    Set up DB, test job, mocks, and orchestrator for full-flow test.
-    Depends on miner_process so miner is running before we use it.
-    Yields (orchestrator, job). Tears down Tortoise after test.
+    Create the test job, patch chain/pool services, and build the orchestrator.
+    Yields (orchestrator, job).
     """
-    metagraph = mock_metagraph_with_miner
-    dendrite = bt.Dendrite(wallet=validator_wallet)
-
-    await Tortoise.init(
-        db_url="sqlite://:memory:",
-        modules={"models": ["validator.models.job"]},
-    )
-    await Tortoise.generate_schemas(safe=True)
     job_repo = JobRepository()
 
     job = await Job.create(
@@ -56,21 +51,24 @@ async def full_flow_env(
         round_duration_seconds=60,
     )
 
-    with (
-        mock.patch("validator.round_orchestrator.SnLiqManagerService") as MockLiq,
-        mock.patch("validator.round_orchestrator.PoolDataDB") as MockDB,
-        mock.patch("validator.round_orchestrator.AsyncWeb3Helper") as MockWeb3,
-    ):
-        liq_instance = MockLiq.return_value
+    with mock.patch.multiple(
+        "validator.round_orchestrator",
+        SnLiqManagerService=mock.DEFAULT,
+        PoolDataDB=mock.DEFAULT,
+        AsyncWeb3Helper=mock.DEFAULT,
+        are_miners_whitelisted=lambda hotkeys: [True] * len(hotkeys),
+    ) as patched:
+        liq_instance = patched["SnLiqManagerService"].return_value
         liq_instance.get_inventory = mock.AsyncMock(
             return_value=Inventory(amount0="1000000000000000000", amount1="1000000000000000000")
         )
         liq_instance.get_current_positions = mock.AsyncMock(return_value=[])
+        liq_instance.get_tick_spacing = mock.AsyncMock(return_value=200)
         liq_instance.get_current_price = mock.AsyncMock(
             return_value=79228162514264337593543950336
         )
 
-        db_instance = MockDB.return_value
+        db_instance = patched["PoolDataDB"].return_value
         db_instance.get_swap_events = mock.AsyncMock(
             return_value=[
                 {
@@ -94,54 +92,109 @@ async def full_flow_env(
             metagraph=metagraph,
             config=config,
         )
-        orchestrator._get_latest_block = mock.AsyncMock(
-            side_effect=[200, 210, 300] + [300] * 100
-        )
+        blocks = iter([200, 210])
+
+        async def latest_block(chain_id):
+            # 200, 210, then the chain "stops" at 300 for the rest of the round
+            return next(blocks, 300)
+
+        orchestrator._get_latest_block = latest_block
 
-        job.round_duration_seconds = 60
-        await job.save()
         await orchestrator._initialize_round_numbers(job)
 
-        try:
-            yield orchestrator, job
-        finally:
-            pass
+        yield orchestrator, job
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def full_flow_env(
+    validator_wallet,
+    miner_wallet,
+    mock_metagraph_with_miner,
+    miner_process,
+    clean_db,
+):
+    """
+    Set up test job, mocks, and orchestrator for full-flow test.
+    Depends on miner_process so miner is running before we use it.
+    Yields (orchestrator, job). Uses the session DB, emptied per test.
+    """
+    dendrite = bt.Dendrite(wallet=validator_wallet)
+    async with _orchestrator_env(dendrite, mock_metagraph_with_miner) as env:
+        yield env
+
+
+async def _canned_dendrite(axons, synapse, timeout, deserialize):
+    """Stand-in for bt.Dendrite: every axon accepts and deploys all inventory."""
+    responses = []
+    for _ in axons:
+        response = synapse.model_copy()
+        response.accepted = True
+        response.desired_positions = [
+            Position(
+                tick_lower=-2000,
+                tick_upper=2000,
+                allocation0=synapse.inventory_remaining.amount0,
+                allocation1=synapse.inventory_remaining.amount1,
+            )
+        ]
+        responses.append(response)
+    return responses
+
+
+@pytest_asyncio.fixture(loop_scope="session")
+async def mocked_flow_env(clean_db):
+    """Same as full_flow_env, but no miner subprocess: the dendrite is canned."""
+    dendrite = mock.AsyncMock(side_effect=_canned_dendrite)
+    metagraph = FakeMetagraph(
+        S=np.array([1.0], dtype=np.float32),
+        uids=[0],
+        hotkeys=["test_miner_hotkey"],
+        axons=[None],
+    )
+    async with _orchestrator_env(dendrite, metagraph) as env:
+        yield env
+
 
-    if Tortoise._inited:
-        await Tortoise.close_connections()
+async def _run_round_and_check(orchestrator, job):
+    """Run one evaluation round on a fast clock; assert it completes with uid 0 winning."""
+    start_dt = datetime.now(timezone.utc)
 
+    def dt_side_effect(tz=None):
+        nonlocal start_dt
+        start_dt += timedelta(seconds=15)
+        return start_dt
 
-class TestFullFlow:
-    """Full-flow integration test: miner running, validator runs evaluation round."""
+    with mock.patch("validator.orchestrator.round_loops.datetime") as mock_dt:
+        mock_dt.now.side_effect = dt_side_effect
+        mock_dt.timezone = timezone
+        await orchestrator.run_evaluation_round(job)
 
-    @pytest.mark.asyncio
-    @pytest.mark.slow
-    async def test_full_flow(self, full_flow_env):
-        """Run evaluation round against live miner; assert round completes and winner set."""
-        orchestrator, job = full_flow_env
+    rounds = await Round.filter(job=job).prefetch_related("predictions")
+    assert len(rounds) == 1
+    r = rounds[0]
+    assert r.status == "completed"
 
-        start_dt = datetime.now(timezone.utc)
+    predictions = list(r.predictions)
+    assert len(predictions) >= 1
 
-        def dt_side_effect(tz=None):
-            nonlocal start_dt
-            start_dt += timedelta(seconds=15)
-            return start_dt
+    logger.info(f"Round completed successfully! Winner: {r.winner_uid}")
+    assert r.winner_uid == 0
 
-        with mock.patch("validator.orchestrator.round_loops.datetime") as mock_dt:
-            mock_dt.now.side_effect = dt_side_effect
-            mock_dt.timezone = timezone
-            await orchestrator.run_evaluation_round(job)
 
-        rounds = await Round.filter(job=job).all()
-        assert len(rounds) == 1
-        r = rounds[0]
-        assert r.status == "completed"
+class TestFullFlow:
+    """Full-flow integration test: validator runs an evaluation round against a miner."""
 
-        predictions = await Prediction.filter(round=r).all()
-        assert len(predictions) >= 1
+    @pytest.mark.slow
+    async def test_full_flow(self, full_flow_env):
+        """Run evaluation round against live miner; assert round completes and winner set."""
+        orchestrator, job = full_flow_env
+        await _run_round_and_check(orchestrator, job)
 
-        logger.info(f"Round completed successfully! Winner: {r.winner_uid}")
-        assert r.winner_uid == 0
+    async def test_full_flow_mocked_dendrite(self, mocked_flow_env):
+        """Run evaluation round against a canned dendrite (no miner subprocess)."""
+        orchestrator, job = mocked_flow_env
+        await _run_round_and_check(orchestrator, job)
+        assert orchestrator.dendrite.await_count >= 1
 
 
 if __name__ == "__main__":
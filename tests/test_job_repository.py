@@ -0,0 +1,34 @@
+"""
+Tests for JobRepository argument checks that run before any database access.
+"""
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from validator.repositories.job import JobRepository
+
+
+@pytest.mark.parametrize(
+    "preloaded",
+    [
+        {"job": SimpleNamespace(job_id="other_job")},
+        {"round_obj": SimpleNamespace(round_id="other_round")},
+    ],
+    ids=["job", "round"],
+)
+async def test_save_rebalance_decision_rejects_mismatched_objects(preloaded):
+    with patch("validator.repositories.job.Prediction.update_or_create") as upsert:
+        with pytest.raises(ValueError, match="does not match"):
+            await JobRepository().save_rebalance_decision(
+                round_id="round_1",
+                job_id="job_1",
+                miner_uid=1,
+                miner_hotkey="hk1",
+                accepted=False,
+                rebalance_data=None,
+                refusal_reason="declined",
+                response_time_ms=0,
+                **preloaded,
+            )
+    upsert.assert_not_called()
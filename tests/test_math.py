@@ -3,22 +3,17 @@ import pytest
 from validator.utils.math import UniswapV3Math
 
 class TestUniswapV3Math:
-    def test_get_sqrt_ratio_at_tick_zero(self):
-        # Tick 0 should be exactly 2^96
-        expected = 1 << 96
-        assert UniswapV3Math.get_sqrt_ratio_at_tick(0) == expected
-
-    def test_get_sqrt_ratio_at_tick_min(self):
-        # Min tick
-        tick = UniswapV3Math.MIN_TICK
-        ratio = UniswapV3Math.get_sqrt_ratio_at_tick(tick)
-        assert ratio == UniswapV3Math.MIN_SQRT_RATIO
-
-    def test_get_sqrt_ratio_at_tick_max(self):
-        # Max tick
-        tick = UniswapV3Math.MAX_TICK
-        ratio = UniswapV3Math.get_sqrt_ratio_at_tick(tick)
-        assert ratio == UniswapV3Math.MAX_SQRT_RATIO
+    @pytest.mark.parametrize(
+        "tick, expected",
+        [
+            # Tick 0 should be exactly 2^96
+            pytest.param(0, 1 << 96, id="zero"),
+            pytest.param(UniswapV3Math.MIN_TICK, UniswapV3Math.MIN_SQRT_RATIO, id="min"),
+            pytest.param(UniswapV3Math.MAX_TICK, UniswapV3Math.MAX_SQRT_RATIO, id="max"),
+        ],
+    )
+    def test_get_sqrt_ratio_at_tick(self, tick, expected):
+        assert UniswapV3Math.get_sqrt_ratio_at_tick(tick) == expected
 
     def test_liquidity_calculation_in_range(self):
         # Price is within range [tick_lower, tick_upper]
@@ -0,0 +1,38 @@
+"""
+Tests for the job models' JSON fields.
+
+Prediction and performance payloads carry uint160 sqrtPriceX96 values and wei
+amounts, so they must round-trip ints wider than 64 bits exactly, whether or
+not orjson happens to be installed.
+"""
+import pytest
+
+from tests.common import ensure_project_root
+
+ensure_project_root()
+
+from validator.models.job import LiveExecution, MinerScore, Prediction, Round
+
+WIDE_INT = 1461446703485210103287273052203988822378723970342  # > 2**64
+
+
+@pytest.mark.parametrize(
+    "model, field_name",
+    [
+        (Prediction, "prediction_data"),
+        (Prediction, "simulated_performance"),
+        (Round, "performance_data"),
+        (MinerScore, "score_history"),
+        (LiveExecution, "strategy_data"),
+    ],
+)
+def test_json_field_round_trips_wide_int(model, field_name):
+    field = model._meta.fields_map[field_name]
+    payload = {"rebalances": [{"price": WIDE_INT, "amount0": str(WIDE_INT)}]}
+
+    stored = field.to_db_value(payload, None)
+    loaded = field.to_python_value(stored)
+
+    assert stored == f'{{"rebalances":[{{"price":{WIDE_INT},"amount0":"{WIDE_INT}"}}]}}'
+    assert loaded == payload
+    assert type(loaded["rebalances"][0]["price"]) is int
@@ -0,0 +1,134 @@
+"""
+Tests for the miner whitelist helpers (validator.utils.whitelist).
+
+Each test points WHITELIST_FILE at its own temp file, so the parse caches
+(keyed by path and mtime) never leak between tests.
+"""
+import json
+import os
+
+import pytest
+
+from validator.utils import whitelist
+
+
+def _write(path, entries, bump_mtime=False):
+    """Write ``entries`` as the whitelist; optionally move the mtime forward 1s."""
+    before = os.stat(path).st_mtime_ns if bump_mtime else None
+    path.write_text(json.dumps(entries) if not isinstance(entries, str) else entries)
+    if bump_mtime:
+        mtime_ns = before + 1_000_000_000
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+@pytest.fixture
+def whitelist_file(tmp_path, monkeypatch):
+    path = tmp_path / "miner_whitelist.json"
+    _write(path, [{"name": "a", "hotkey": "hk_a"}, {"name": "b", "hotkey": "hk_b"}])
+    monkeypatch.setattr(whitelist, "WHITELIST_FILE", str(path))
+    return path
+
+
+def test_get_whitelisted_miners_sees_file_edits(whitelist_file):
+    assert [m["hotkey"] for m in whitelist.get_whitelisted_miners()] == ["hk_a", "hk_b"]
+
+    _write(whitelist_file, [{"name": "c", "hotkey": "hk_c"}], bump_mtime=True)
+
+    assert whitelist.get_whitelisted_miners() == [{"name": "c", "hotkey": "hk_c"}]
+
+
+def test_get_whitelisted_miners_returns_copies(whitelist_file):
+    miners = whitelist.get_whitelisted_miners()
+    miners[0]["hotkey"] = "mutated"
+    miners.append({"name": "x", "hotkey": "hk_x"})
+
+    assert whitelist.get_whitelisted_miners() == [
+        {"name": "a", "hotkey": "hk_a"},
+        {"name": "b", "hotkey": "hk_b"},
+    ]
+
+
+def _linear_scan(hotkey):
+    """The original is_miner_whitelisted: scan every entry on each call."""
+    if not hotkey:
+        return False
+    return any(item.get("hotkey") == hotkey for item in whitelist.get_whitelisted_miners())
+
+
+@pytest.mark.parametrize("hotkey", ["hk_a", "hk_b", "hk_missing", "", None, "HK_A"])
+def test_is_miner_whitelisted_matches_linear_scan(whitelist_file, hotkey):
+    assert whitelist.is_miner_whitelisted(hotkey) == _linear_scan(hotkey)
+
+
+def test_is_miner_whitelisted_sees_file_edits(whitelist_file):
+    assert whitelist.is_miner_whitelisted("hk_a")
+    assert not whitelist.is_miner_whitelisted("hk_c")
+
+    _write(whitelist_file, [{"name": "c", "hotkey": "hk_c"}], bump_mtime=True)
+
+    assert not whitelist.is_miner_whitelisted("hk_a")
+    assert whitelist.is_miner_whitelisted("hk_c")
+
+
+def test_are_miners_whitelisted_mixed_and_ordered(whitelist_file):
+    hotkeys = ["hk_x", "hk_b", "", "hk_a", "hk_b", "hk_y"]
+
+    assert whitelist.are_miners_whitelisted(hotkeys) == [
+        False, True, False, True, True, False,
+    ]
+    assert whitelist.are_miners_whitelisted(hotkeys) == [
+        whitelist.is_miner_whitelisted(hk) for hk in hotkeys
+    ]
+
+
+def test_are_miners_whitelisted_empty_input(whitelist_file):
+    assert whitelist.are_miners_whitelisted([]) == []
+
+
+@pytest.mark.parametrize(
+    "contents",
+    [
+        pytest.param(None, id="missing"),
+        pytest.param("{not json", id="invalid_json"),
+        pytest.param('{"hotkey": "hk_a"}', id="not_a_list"),
+    ],
+)
+def test_are_miners_whitelisted_bad_file(whitelist_file, contents):
+    if contents is None:
+        whitelist_file.unlink()
+    else:
+        _write(whitelist_file, contents, bump_mtime=True)
+
+    assert whitelist.are_miners_whitelisted(["hk_a", "hk_b"]) == [False, False]
+
+
+def _pin_mtime(path, mtime_ns):
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_read_failure_is_not_cached(whitelist_file):
+    # A read that lands mid-rewrite sees a truncated file with the final mtime
+    valid = '[{"hotkey":"hk_a"}]'
+    _write(whitelist_file, valid[:-1] + " ")
+    mtime_ns = os.stat(whitelist_file).st_mtime_ns
+
+    assert whitelist.are_miners_whitelisted(["hk_a"]) == [False]
+    assert whitelist.get_whitelisted_miners() == []
+
+    # The finished write keeps the same size and mtime tick
+    _write(whitelist_file, valid)
+    _pin_mtime(whitelist_file, mtime_ns)
+
+    assert whitelist.are_miners_whitelisted(["hk_a"]) == [True]
+    assert whitelist.get_whitelisted_miners() == [{"hotkey": "hk_a"}]
+
+
+def test_same_mtime_different_size_is_reloaded(whitelist_file):
+    mtime_ns = os.stat(whitelist_file).st_mtime_ns
+    assert whitelist.is_miner_whitelisted("hk_a")
+
+    _write(whitelist_file, [{"name": "c", "hotkey": "hk_c"}])
+    _pin_mtime(whitelist_file, mtime_ns)
+
+    assert not whitelist.is_miner_whitelisted("hk_a")
+    assert whitelist.is_miner_whitelisted("hk_c")
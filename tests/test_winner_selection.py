@@ -15,29 +15,22 @@ DB-backed tests (TestHistoric*, TestEligible*, TestTop*) require Postgres
 (JOBS_POSTGRES_* in env). Unit tests (TestSelectWinner, TestRankMiners*) run without DB.
 """
 import unittest
-import asyncio
 import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from unittest.mock import MagicMock, AsyncMock, patch
-from datetime import datetime, timezone
 from decimal import Decimal
 
 from tortoise import Tortoise
 
 from validator.round_orchestrator import AsyncRoundOrchestrator
-from validator.models.job import Job, MinerScore, RoundType
+from validator.models.job import Job, MinerScore
 from validator.repositories.job import JobRepository
 from validator.services.scorer import Scorer
-from validator.utils.env import (
-    JOBS_POSTGRES_HOST,
-    JOBS_POSTGRES_PORT,
-    JOBS_POSTGRES_DB,
-    JOBS_POSTGRES_USER,
-    JOBS_POSTGRES_PASSWORD,
-)
+
+from tests.common import init_postgres_db, unique_job_id
 
 
 # --- Unit tests: _select_winner (mocked repo) ---
@@ -46,23 +39,24 @@ from validator.utils.env import (
 class TestSelectWinner(unittest.IsolatedAsyncioTestCase):
     """Unit tests for _select_winner with mocked JobRepository."""
 
+    @classmethod
+    def setUpClass(cls):
+        # _select_winner only touches the repository, so one orchestrator serves
+        # every test; PoolDataDB is patched just for construction.
+        metagraph = MagicMock()
+        metagraph.hotkeys = ["h0", "h1", "h2"]
+        with patch("validator.round_orchestrator.PoolDataDB"):
+            cls.orchestrator = AsyncRoundOrchestrator(
+                AsyncMock(spec=JobRepository),
+                AsyncMock(),
+                metagraph,
+                {"rebalance_check_interval": 100},
+            )
+
     async def asyncSetUp(self):
+        # Fresh repository mock per test so call history never leaks between tests
         self.mock_repo = AsyncMock(spec=JobRepository)
-        self.mock_dendrite = AsyncMock()
-        self.mock_metagraph = MagicMock()
-        self.mock_metagraph.hotkeys = ["h0", "h1", "h2"]
-        self.config = {"rebalance_check_interval": 100}
-
-        self._pool_patcher = patch("validator.round_orchestrator.PoolDataDB")
-        self._pool_patcher.start()
-        self.addCleanup(self._pool_patcher.stop)
-
-        self.orchestrator = AsyncRoundOrchestrator(
-            self.mock_repo,
-            self.mock_dendrite,
-            self.mock_metagraph,
-            self.config,
-        )
+        self.orchestrator.job_repository = self.mock_repo
 
     async def test_select_winner_empty_scores(self):
         winner = await self.orchestrator._select_winner("job1", {})
@@ -140,22 +134,23 @@ class TestSelectWinner(unittest.IsolatedAsyncioTestCase):
 # --- Integration tests: JobRepository (real DB) ---
 
 
-class TestHistoricCombinedScores(unittest.IsolatedAsyncioTestCase):
+class _PostgresTestCase(unittest.IsolatedAsyncioTestCase):
+    """Connects Tortoise to the jobs Postgres DB; the connection is closed on cleanup."""
+
+    async def asyncSetUp(self):
+        await init_postgres_db()
+        # Registered before any seeding so a failing subclass setUp still closes the pool.
+        self.addAsyncCleanup(Tortoise.close_connections)
+
+
+class TestHistoricCombinedScores(_PostgresTestCase):
     """Integration tests for get_historic_combined_scores with real DB."""
 
     async def asyncSetUp(self):
-        db_url = (
-            f"postgres://{JOBS_POSTGRES_USER}:{JOBS_POSTGRES_PASSWORD}@"
-            f"{JOBS_POSTGRES_HOST}:{JOBS_POSTGRES_PORT}/{JOBS_POSTGRES_DB}"
-        )
-        await Tortoise.init(
-            db_url=db_url,
-            modules={"models": ["validator.models.job", "validator.models.pool_events"]},
-        )
-        await Tortoise.generate_schemas(safe=True)
+        await super().asyncSetUp()
         self.repo = JobRepository()
         self.job = await Job.create(
-            job_id=f"test_historic_{int(datetime.now(timezone.utc).timestamp())}",
+            job_id=unique_job_id("test_historic"),
             sn_liquidity_manager_address="0xabc",
             pair_address="0xdef",
             chain_id=8453,
@@ -163,10 +158,6 @@ class TestHistoricCombinedScores(unittest.IsolatedAsyncioTestCase):
             fee_rate=3000,
         )
 
-    async def asyncTearDown(self):
-        if Tortoise._inited:
-            await Tortoise.close_connections()
-
     async def test_get_historic_combined_scores_empty_uids(self):
         out = await self.repo.get_historic_combined_scores(self.job.job_id, [])
         self.assertEqual(out, {})
@@ -204,22 +195,14 @@ class TestHistoricCombinedScores(unittest.IsolatedAsyncioTestCase):
         self.assertNotIn(3, out)
 
 
-class TestEligibleMinersTieBreak(unittest.IsolatedAsyncioTestCase):
+class TestEligibleMinersTieBreak(_PostgresTestCase):
     """Test get_eligible_miners tie-break ordering."""
 
     async def asyncSetUp(self):
-        db_url = (
-            f"postgres://{JOBS_POSTGRES_USER}:{JOBS_POSTGRES_PASSWORD}@"
-            f"{JOBS_POSTGRES_HOST}:{JOBS_POSTGRES_PORT}/{JOBS_POSTGRES_DB}"
-        )
-        await Tortoise.init(
-            db_url=db_url,
-            modules={"models": ["validator.models.job", "validator.models.pool_events"]},
-        )
-        await Tortoise.generate_schemas(safe=True)
+        await super().asyncSetUp()
         self.repo = JobRepository()
         self.job = await Job.create(
-            job_id=f"test_eligible_{int(datetime.now(timezone.utc).timestamp())}",
+            job_id=unique_job_id("test_eligible"),
             sn_liquidity_manager_address="0xaaa",
             pair_address="0xbbb",
             chain_id=8453,
@@ -227,10 +210,6 @@ class TestEligibleMinersTieBreak(unittest.IsolatedAsyncioTestCase):
             fee_rate=3000,
         )
 
-    async def asyncTearDown(self):
-        if Tortoise._inited:
-            await Tortoise.close_connections()
-
     async def test_eligible_miners_tie_break_by_evaluations_then_live(self):
         for uid, evals, live in [(1, 5, 2), (2, 10, 1), (3, 5, 5)]:
             await MinerScore.create(
@@ -255,22 +234,14 @@ class TestEligibleMinersTieBreak(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(miners[2].miner_uid, 1)  # 5 evals, 2 live
 
 
-class TestTopMinersByJobTieBreak(unittest.IsolatedAsyncioTestCase):
+class TestTopMinersByJobTieBreak(_PostgresTestCase):
     """Test get_top_miners_by_job tie-break (one winner per job)."""
 
     async def asyncSetUp(self):
-        db_url = (
-            f"postgres://{JOBS_POSTGRES_USER}:{JOBS_POSTGRES_PASSWORD}@"
-            f"{JOBS_POSTGRES_HOST}:{JOBS_POSTGRES_PORT}/{JOBS_POSTGRES_DB}"
-        )
-        await Tortoise.init(
-            db_url=db_url,
-            modules={"models": ["validator.models.job", "validator.models.pool_events"]},
-        )
-        await Tortoise.generate_schemas(safe=True)
+        await super().asyncSetUp()
         self.repo = JobRepository()
         self.job = await Job.create(
-            job_id=f"test_top_{int(datetime.now(timezone.utc).timestamp())}",
+            job_id=unique_job_id("test_top"),
             sn_liquidity_manager_address="0xccc",
             pair_address="0xddd",
             chain_id=8453,
@@ -278,10 +249,6 @@ class TestTopMinersByJobTieBreak(unittest.IsolatedAsyncioTestCase):
             fee_rate=3000,
         )
 
-    async def asyncTearDown(self):
-        if Tortoise._inited:
-            await Tortoise.close_connections()
-
     async def test_top_miners_by_job_tie_break(self):
         await MinerScore.create(
             job=self.job,
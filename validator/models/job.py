@@ -3,6 +3,8 @@ Tortoise ORM Models for SN98 Jobs System.
 
 All database operations are async using Tortoise ORM.
 """
+import functools
+import json
 from enum import Enum
 from typing import Optional
 
@@ -19,6 +21,16 @@ from validator.utils.env import (
 )
 
 
+# Pin the stdlib codec: Tortoise switches JSONFields to orjson whenever it is
+# importable, and orjson rejects ints wider than 64 bits (and decodes them as
+# floats). Prediction data carries uint160 sqrtPriceX96 values and wei amounts.
+_json_dumps = functools.partial(json.dumps, separators=(",", ":"))
+
+
+def _json_field(**kwargs) -> fields.JSONField:
+    return fields.JSONField(encoder=_json_dumps, decoder=json.loads, **kwargs)
+
+
 class RoundType(str, Enum):
     """Round type enum."""
 
@@ -54,7 +66,7 @@ class Job(Model):
     round_duration_seconds = fields.IntField(default=900)
     created_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
-    metadata = fields.JSONField(null=True)
+    metadata = _json_field(null=True)
 
     # Relations
     rounds: fields.ReverseRelation["Round"]
@@ -87,7 +99,7 @@ class Round(Model):
     winner_uid = fields.IntField(null=True)
     start_block = fields.IntField()
     status = fields.CharEnumField(RoundStatus, default=RoundStatus.PENDING, db_index=True)
-    performance_data = fields.JSONField(null=True)
+    performance_data = _json_field(null=True)
     created_at = fields.DatetimeField(auto_now_add=True)
 
     # Relations
@@ -121,9 +133,9 @@ class Prediction(Model):
     accepted = fields.BooleanField(default=False)
     refusal_reason = fields.TextField(null=True)
     response_time_ms = fields.IntField(null=True)
-    prediction_data = fields.JSONField(null=True)  # Rebalancing decisions
+    prediction_data = _json_field(null=True)  # Rebalancing decisions
     submitted_at = fields.DatetimeField(auto_now_add=True)
-    simulated_performance = fields.JSONField(null=True)
+    simulated_performance = _json_field(null=True)
 
     class Meta:
         table = "predictions"
@@ -169,7 +181,7 @@ class MinerScore(Model):
     is_eligible_for_live = fields.BooleanField(default=False, db_index=True)
 
     # Historical data
-    score_history = fields.JSONField(null=True)
+    score_history = _json_field(null=True)
 
     updated_at = fields.DatetimeField(auto_now=True)
 
@@ -231,12 +243,12 @@ class LiveExecution(Model):
     sn_liquidity_manager_address = fields.CharField(max_length=42)
 
     # Execution details
-    strategy_data = fields.JSONField()
+    strategy_data = _json_field()
     tx_hash = fields.CharField(max_length=66, null=True)
     tx_status = fields.CharField(max_length=20, null=True)
 
     # Performance tracking
-    actual_performance = fields.JSONField(null=True)
+    actual_performance = _json_field(null=True)
 
     executed_at = fields.DatetimeField(auto_now_add=True)
     updated_at = fields.DatetimeField(auto_now=True)
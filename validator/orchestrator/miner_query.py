@@ -59,7 +59,7 @@ async def query_miners_for_rebalance(
         block_number=block_number,
         current_price=current_price,
         current_positions=current_positions,
-        inventory_remaining={"amount0": inventory.amount0, "amount1": inventory.amount1},
+        inventory_remaining=inventory,
         rebalances_so_far=rebalances_so_far,
         tick_spacing=tick_spacing,
     )
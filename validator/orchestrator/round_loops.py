@@ -216,7 +216,8 @@ async def run_with_miner_for_evaluation(
                         "performance_metrics": {},
                         "total_query_time_ms": total_query_time_ms,
                     }
-                current_inventory = Inventory(
+                # Amounts are locally computed ints; skip re-validation.
+                current_inventory = Inventory.model_construct(
                     amount0=str(amount_0_int), amount1=str(amount_1_int)
                 )
                 rebalance_history.append({
@@ -407,7 +408,8 @@ async def run_with_miners_batch_for_evaluation(
                 if inv_0 < 0 or inv_1 < 0:
                     per_miner_refused[uid] = "Insufficient inventory from desired positions"
                     continue
-                new_inventory = Inventory(amount0=str(inv_0), amount1=str(inv_1))
+                # Amounts are locally computed ints; skip re-validation.
+                new_inventory = Inventory.model_construct(amount0=str(inv_0), amount1=str(inv_1))
                 entry = {
                     "block": current_block,
                     "price": rebalance_price,
@@ -436,6 +438,13 @@ async def run_with_miners_batch_for_evaluation(
         f"steps={step_count}, refused={refused_count}, completed_with_rebalances={completed_count}"
     )
 
+    # All miners are backtested over the same pool and block range: load it once
+    market_data = None
+    if any(per_miner_history[uid] for uid in miner_uids if uid not in per_miner_refused):
+        market_data = await backtester.fetch_market_data(
+            job.pair_address, start_block, current_block
+        )
+
     # Build result per miner: backtest and score
     results: Dict[int, Dict[str, Any]] = {}
     for uid in miner_uids:
@@ -473,6 +482,7 @@ async def run_with_miners_batch_for_evaluation(
             current_block,
             initial_inventory,
             job.fee_rate,
+            market_data=market_data,
         )
         miner_score_val = await Scorer.score_pol_strategy(metrics=performance_metrics)
         serialized_history = [_serialize_history_item(h) for h in history]
@@ -604,7 +614,8 @@ async def run_with_miner_for_live(
                             total_a1 += a1
                         amount_0_int = max(0, int(initial_inventory.amount0) - total_a0)
                         amount_1_int = max(0, int(initial_inventory.amount1) - total_a1)
-                        current_inventory = Inventory(
+                        # Amounts are locally computed ints; skip re-validation.
+                        current_inventory = Inventory.model_construct(
                             amount0=str(amount_0_int), amount1=str(amount_1_int)
                         )
                         rebalance_history.append({
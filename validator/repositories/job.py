@@ -134,6 +134,9 @@ class JobRepository:
         rebalance_data: Optional[List[Dict]],
         refusal_reason: Optional[str],
         response_time_ms: int,
+        *,
+        job: Optional[Job] = None,
+        round_obj: Optional[Round] = None,
     ) -> str:
         """
         Save a miner's rebalancing decision to the database.
@@ -147,15 +150,31 @@ class JobRepository:
             rebalance_data: List of rebalancing decisions
             refusal_reason: Reason for refusal (if declined)
             response_time_ms: Response time in milliseconds
+            job: Already-loaded Job for job_id (skips the lookup)
+            round_obj: Already-loaded Round for round_id (skips the lookup)
 
         Returns:
             Prediction ID
+
+        Raises:
+            ValueError: If job or round_obj does not match job_id or round_id
         """
+        # Preloaded objects must be the ones the ids name, or the prediction
+        # would be filed under one round/job and keyed by another
+        if job is not None and job.job_id != job_id:
+            raise ValueError(f"job {job.job_id} does not match job_id {job_id}")
+        if round_obj is not None and round_obj.round_id != round_id:
+            raise ValueError(
+                f"round {round_obj.round_id} does not match round_id {round_id}"
+            )
+
         prediction_id = f"{round_id}_{miner_uid}"
 
-        # Get job and round objects
-        job = await Job.get(job_id=job_id)
-        round_obj = await Round.get(round_id=round_id)
+        # Get job and round objects unless the caller already holds them
+        if job is None:
+            job = await Job.get(job_id=job_id)
+        if round_obj is None:
+            round_obj = await Round.get(round_id=round_id)
 
         # Serialize rebalance_data to make it JSON-serializable
         # Convert Inventory and Position objects to dicts
@@ -290,7 +309,12 @@ class JobRepository:
         return score
 
     async def update_miner_participation(
-        self, job_id: str, miner_uid: int, accepted: bool
+        self,
+        job_id: str,
+        miner_uid: int,
+        accepted: bool,
+        *,
+        today: Optional[date] = None,
     ):
         """
         Track daily participation for a miner on a job.
@@ -304,9 +328,12 @@ class JobRepository:
             job_id: Job identifier
             miner_uid: Miner UID
             accepted: True if miner was running and accepted; False if refused/not running
+            today: Participation date; callers updating a whole round pass one shared
+                value (defaults to date.today())
         """
         job = await Job.get(job_id=job_id)
-        today = date.today()
+        if today is None:
+            today = date.today()
 
         participation, created = await MinerParticipation.update_or_create(
             job=job,
@@ -481,17 +508,18 @@ class JobRepository:
         Returns:
             Dict mapping job_id -> miner_uid
         """
-        jobs = await Job.filter(is_active=True)
-        winners = {}
-        for job in jobs:
-            top = await MinerScore.filter(job=job).order_by(
-                "-combined_score",
-                "-total_evaluations",
-                "-total_live_rounds",
-            ).first()
-            if top:
-                winners[job.job_id] = top.miner_uid
-        return winners
+        # One query for every active job, best score first within each job
+        rows = await MinerScore.filter(job__is_active=True).order_by(
+            "job_id",
+            "-combined_score",
+            "-total_evaluations",
+            "-total_live_rounds",
+        ).values_list("job__job_id", "miner_uid")
+
+        top_miners: Dict[str, int] = {}
+        for job_id, miner_uid in rows:
+            top_miners.setdefault(job_id, miner_uid)
+        return top_miners
 
     async def zero_out_miner(self, miner_uid: int) -> None:
         """
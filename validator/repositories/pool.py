@@ -8,7 +8,7 @@ Includes retry logic for transient failures.
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import List, Dict, Any, Optional
 
 from tortoise import Tortoise
@@ -20,6 +20,12 @@ from validator.models.pool_events import SwapEvent, MintEvent, BurnEvent, Collec
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _clean_address(address: str) -> str:
+    """Normalize an address to the DB form: lowercase hex without 0x prefix."""
+    return address.lower().replace("0x", "")
+
+
 class DataSource(ABC):
     """
     Abstract base class for pool data sources.
@@ -185,7 +191,7 @@ class PoolDataDB(DataSource):
             List of swap event dictionaries
         """
         # Remove 0x prefix if present for DB query
-        clean_address = pair_address.lower().replace("0x", "")
+        clean_address = _clean_address(pair_address)
 
         # Build query
         query = SwapEvent.filter(evt_address=clean_address)
@@ -235,7 +241,7 @@ class PoolDataDB(DataSource):
         Get the price (token1/token0) at a specific block.
         Uses the most recent swap before or at the block.
         """
-        clean_address = pair_address.lower().replace("0x", "")
+        clean_address = _clean_address(pair_address)
 
         result = await (
             SwapEvent.filter(
@@ -259,7 +265,7 @@ class PoolDataDB(DataSource):
         end_block: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Fetch mint (liquidity addition) events."""
-        clean_address = pair_address.lower().replace("0x", "")
+        clean_address = _clean_address(pair_address)
 
         # Build query
         query = MintEvent.filter(evt_address=clean_address)
@@ -307,7 +313,7 @@ class PoolDataDB(DataSource):
         end_block: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Fetch burn (liquidity removal) events."""
-        clean_address = pair_address.lower().replace("0x", "")
+        clean_address = _clean_address(pair_address)
 
         # Build query
         query = BurnEvent.filter(evt_address=clean_address)
@@ -353,7 +359,7 @@ class PoolDataDB(DataSource):
         end_block: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """Fetch collect (fee collection) events."""
-        clean_address = pair_address.lower().replace("0x", "")
+        clean_address = _clean_address(pair_address)
 
         # Build query
         query = CollectEvent.filter(evt_address=clean_address)
@@ -401,7 +407,7 @@ class PoolDataDB(DataSource):
         Returns:
             Dictionary with 'fee0' and 'fee1' keys
         """
-        clean_address = pair_address.lower().replace("0x", "")
+        clean_address = _clean_address(pair_address)
 
         result = await (
             CollectEvent.filter(
@@ -427,7 +433,7 @@ class PoolDataDB(DataSource):
         """
         Get the current tick at a specific block.
         """
-        clean_address = pair_address.lower().replace("0x", "")
+        clean_address = _clean_address(pair_address)
 
         result = await (
             SwapEvent.filter(
@@ -457,7 +463,7 @@ class PoolDataDB(DataSource):
         """
         # Clean addresses
         clean_addresses = [
-            addr.lower().replace("0x", "") for addr in sn_liquidity_manager_addresses
+            _clean_address(addr) for addr in sn_liquidity_manager_addresses
         ]
 
         results = await (
@@ -14,7 +14,7 @@ Orchestration logic is split across validator.orchestrator:
 """
 import asyncio
 import logging
-from datetime import datetime, timezone
+from datetime import date, datetime, timezone
 from typing import Dict, List, Optional
 
 import bittensor as bt
@@ -32,7 +32,7 @@ from validator.orchestrator.round_loops import (
     run_with_miners_batch_for_evaluation,
 )
 from validator.orchestrator.winner import select_winner
-from validator.utils.whitelist import is_miner_whitelisted
+from validator.utils.whitelist import are_miners_whitelisted
 
 logger = logging.getLogger(__name__)
 
@@ -66,12 +66,14 @@ class AsyncRoundOrchestrator:
 
     async def _initialize_round_numbers(self, job: Job) -> None:
         """Initialize round numbers from database for a job."""
-        eval_round = await Round.filter(
-            job=job, round_type=RoundType.EVALUATION
-        ).order_by("-round_number").first()
-        live_round = await Round.filter(
-            job=job, round_type=RoundType.LIVE
-        ).order_by("-round_number").first()
+        eval_round, live_round = await asyncio.gather(
+            Round.filter(job=job, round_type=RoundType.EVALUATION)
+            .order_by("-round_number")
+            .first(),
+            Round.filter(job=job, round_type=RoundType.LIVE)
+            .order_by("-round_number")
+            .first(),
+        )
         self.round_numbers[job.job_id] = {
             "evaluation": eval_round.round_number if eval_round else 0,
             "live": live_round.round_number if live_round else 0,
@@ -114,10 +116,11 @@ class AsyncRoundOrchestrator:
             job.pair_address,
         )
         my_uid = self.config.get("my_uid")
+        whitelisted = are_miners_whitelisted(self.metagraph.hotkeys)
         active_uids = [
             uid
             for uid in range(len(self.metagraph.S))
-            if (my_uid is None or uid != my_uid) and is_miner_whitelisted(self.metagraph.hotkeys[uid])
+            if (my_uid is None or uid != my_uid) and whitelisted[uid]
         ]
         if not active_uids:
             logger.warning("No active miners found.")
@@ -169,6 +172,7 @@ class AsyncRoundOrchestrator:
         # Run score + participation updates in parallel batches to reduce DB latency
         job_id = job.job_id
         items = list(scores.items())
+        today = date.today()
 
         async def _update_one(uid: int, data: dict) -> None:
             accepted = data["accepted"]
@@ -181,7 +185,7 @@ class AsyncRoundOrchestrator:
                 accepted=accepted,
             )
             await self.job_repository.update_miner_participation(
-                job_id=job_id, miner_uid=uid, accepted=accepted
+                job_id=job_id, miner_uid=uid, accepted=accepted, today=today
             )
 
         for i in range(0, len(items), SCORE_UPDATE_BATCH_SIZE):
@@ -207,10 +211,13 @@ class AsyncRoundOrchestrator:
                 f"No evaluation ranking for job {job.job_id}, skipping live round"
             )
             return
+        eligible = await self.job_repository.get_eligible_miners(job.job_id)
         eligible_uids = {
             s.miner_uid
-            for s in await self.job_repository.get_eligible_miners(job.job_id)
-            if is_miner_whitelisted(s.miner_hotkey)
+            for s, ok in zip(
+                eligible, are_miners_whitelisted([s.miner_hotkey for s in eligible])
+            )
+            if ok
         }
         winner_uid = None
         for uid in ranking:
@@ -329,6 +336,8 @@ class AsyncRoundOrchestrator:
                 rebalance_data=result["rebalance_history"],
                 refusal_reason=None,
                 response_time_ms=result.get("total_query_time_ms", 0),
+                job=job,
+                round_obj=round_obj,
             )
         else:
             logger.warning(
@@ -393,6 +402,8 @@ class AsyncRoundOrchestrator:
                     rebalance_data=res["rebalance_history"],
                     refusal_reason=None,
                     response_time_ms=res.get("total_query_time_ms", 0),
+                    job=job,
+                    round_obj=round_,
                 )
             else:
                 await self.job_repository.save_rebalance_decision(
@@ -404,6 +415,8 @@ class AsyncRoundOrchestrator:
                     rebalance_data=None,
                     refusal_reason=res.get("refusal_reason"),
                     response_time_ms=res.get("total_query_time_ms", 0),
+                    job=job,
+                    round_obj=round_,
                 )
 
         items = list(results.items())
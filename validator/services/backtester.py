@@ -7,10 +7,14 @@ concentrated liquidity positions, including:
 - Accurate impermanent loss computation
 - Rebalance simulation following strategy rules
 """
+import asyncio
 import logging
-from typing import List, Dict, Any
+from bisect import bisect_left
+from typing import List, Dict, Any, Optional, Tuple
 
-from protocol import Position, Inventory
+import numpy as np
+
+from protocol import Inventory
 from validator.repositories.pool import DataSource
 from validator.utils.math import UniswapV3Math
 
@@ -40,13 +44,13 @@ class BacktesterService:
         """
         self.db = data_source  # Keep as self.db for compatibility
 
-    def _calculate_liquidity_share(
+    def _calculate_liquidity_shares(
         self,
-        simulated_in_range_liquidity: float,
-        event: Dict[str, Any],
-    ) -> float:
+        simulated_in_range_liquidity: np.ndarray,
+        pool_liquidity: np.ndarray,
+    ) -> np.ndarray:
         """
-        Calculate the share of fees this position earns from a swap.
+        Calculate the share of fees the simulated positions earn from each swap.
 
         This is the key improvement: instead of assuming 1% share,
         we calculate the actual share based on:
@@ -55,29 +59,89 @@ class BacktesterService:
         3. Whether price is in range
 
         Args:
-            simulated_in_range_liquidity: Liquidity of the positions in range
-            event: Swap event data
+            simulated_in_range_liquidity: Liquidity of the positions in range, per swap
+            pool_liquidity: Pool liquidity reported by each swap event
 
         Returns:
-            Liquidity share (0.0 to 1.0)
+            Liquidity share per swap (0.0 to 1.0)
         """
-        # Get total pool liquidity from event (if available)
-        pool_liquidity = event.get("liquidity")
-        if pool_liquidity:
-            pool_liquidity = float(pool_liquidity) + simulated_in_range_liquidity
-        else:
-            raise ValueError(f"Liquidity not available for event ${event.get('id')}")
+        total_liquidity = pool_liquidity + simulated_in_range_liquidity
 
-        if pool_liquidity <= 0:
+        non_positive = total_liquidity <= 0
+        if non_positive.any():
             logger.warning(
-                f"Pool liquidity is <= 0 ({pool_liquidity}). "
-                "This suggests bad data or a bug. Returning 0 share."
+                f"Pool liquidity is <= 0 for {int(non_positive.sum())} swap(s). "
+                "This suggests bad data or a bug. Using 0 share for them."
             )
-            return 0.0
 
-        # Calculate share (capped at 100% to handle edge cases)
-        share = min(1.0, simulated_in_range_liquidity / pool_liquidity)
-        return share
+        # Calculate share (capped at 100% to handle edge cases), reusing the buffer
+        shares = np.divide(
+            simulated_in_range_liquidity,
+            total_liquidity,
+            out=total_liquidity,
+            where=~non_positive,
+        )
+        shares[non_positive] = 0.0
+        return np.minimum(shares, 1.0, out=shares)
+
+    @staticmethod
+    def _swap_event_columns(swap_events: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Convert swap event rows into the per-swap columns the simulation reads.
+
+        Block numbers and sqrt prices stay Python ints for the exact range and
+        liquidity math; pool liquidity and signed amounts become float arrays.
+
+        Raises:
+            ValueError: If an event has no pool liquidity
+        """
+        for event in swap_events:
+            if not event.get("liquidity"):
+                raise ValueError(f"Liquidity not available for event ${event.get('id')}")
+
+        return {
+            "block": [event.get("evt_block_number") for event in swap_events],
+            "sqrt_price_x96": [int(event.get("sqrt_price_x96")) for event in swap_events],
+            "liquidity": np.array(
+                [float(event["liquidity"]) for event in swap_events], dtype=np.float64
+            ),
+            # Signed: positive = token came IN, negative = token went OUT
+            "amount0": np.array(
+                [float(event.get("amount0", 0) or 0) for event in swap_events],
+                dtype=np.float64,
+            ),
+            "amount1": np.array(
+                [float(event.get("amount1", 0) or 0) for event in swap_events],
+                dtype=np.float64,
+            ),
+        }
+
+    async def fetch_market_data(
+        self,
+        pair_address: str,
+        start_block: int,
+        end_block: int,
+    ) -> Tuple[Dict[str, Any], int, int]:
+        """
+        Load the pool data a backtest over a block range needs.
+
+        Every miner evaluated over the same range shares this data, so callers
+        backtesting several strategies can fetch it once and pass it to
+        evaluate_positions_performance.
+
+        Returns:
+            (swap event columns, initial_sqrt_price_x96, final_sqrt_price_x96)
+        """
+        swap_events, initial_sqrt_price_x96, final_sqrt_price_x96 = await asyncio.gather(
+            self.db.get_swap_events(pair_address, start_block, end_block),
+            self.db.get_sqrt_price_at_block(pair_address, start_block),
+            self.db.get_sqrt_price_at_block(pair_address, end_block),
+        )
+        return (
+            self._swap_event_columns(swap_events),
+            initial_sqrt_price_x96,
+            final_sqrt_price_x96,
+        )
 
     async def evaluate_positions_performance(
         self,
@@ -87,6 +151,8 @@ class BacktesterService:
         end_block: int,
         initial_inventory: Inventory,
         fee_rate: float,
+        *,
+        market_data: Optional[Tuple[Dict[str, Any], int, int]] = None,
     ) -> Dict[str, Any]:
         """
         Simulate a single LP position over a block range using V3 concentrated liquidity math.
@@ -98,6 +164,7 @@ class BacktesterService:
             end_block: Ending block
             initial_inventory: The inventory at the start of the simulation.
             fee_rate: Fee rate for the pool
+            market_data: Result of fetch_market_data for this range; fetched if omitted
 
         Returns:
             Dictionary containing:
@@ -127,84 +194,96 @@ class BacktesterService:
 
         rebalance_history.sort(key=lambda x: x["block"], reverse=True)
 
-        def get_deployed_positions(current_block: int) -> List[Position]:
-            """Get deployed positions for current block."""
-            for rebalance in rebalance_history:
-                if current_block > rebalance["block"]:
-                    return rebalance["new_positions"]
-
-            raise ValueError("Invalid rebalance history.")
-
-        # Get swap events in this range
-        swap_events = await self.db.get_swap_events(
-            pair_address, start_block, end_block
-        )
+        # Rebalances in block order, so the one active at a block is found by bisection
+        rebalances_by_block = rebalance_history[::-1]
+        rebalance_blocks = [rebalance["block"] for rebalance in rebalances_by_block]
+
+        # Tick bounds and allocations are constant between rebalances, so convert
+        # them to (sqrt_price_lower_x96, sqrt_price_upper_x96, amount0, amount1)
+        # once per rebalance instead of once per swap
+        deployed_ranges = [
+            [
+                (
+                    UniswapV3Math.get_sqrt_ratio_at_tick(position.tick_lower),
+                    UniswapV3Math.get_sqrt_ratio_at_tick(position.tick_upper),
+                    int(position.allocation0),
+                    int(position.allocation1),
+                )
+                for position in rebalance["new_positions"]
+            ]
+            for rebalance in rebalances_by_block
+        ]
+
+        def get_deployed_positions(current_block: int) -> List[Tuple[int, int, int, int]]:
+            """Get position ranges of the last rebalance strictly before current block."""
+            index = bisect_left(rebalance_blocks, current_block) - 1
+            if index < 0:
+                raise ValueError("Invalid rebalance history.")
+            return deployed_ranges[index]
+
+        # Get swap events in this range and the boundary prices
+        if market_data is None:
+            market_data = await self.fetch_market_data(
+                pair_address, start_block, end_block
+            )
+        swaps, initial_sqrt_price_x96, final_sqrt_price_x96 = market_data
 
-        # Track fees
-        total_fees0 = 0.0
-        total_fees1 = 0.0
+        # In-range liquidity per swap for the vectorized fee computation
+        total_swaps = len(swaps["block"])
+        in_range_liquidity = np.empty(total_swaps, dtype=np.float64)
         in_range_count = 0
-        total_swaps = len(swap_events)
 
-        # Simulate each swap for fee accumulation
-        for event in swap_events:
-            # Calculate price from sqrt_price_x96 if available
-            sqrt_price_x96 = int(event.get("sqrt_price_x96"))
-            block_number = event.get("evt_block_number")
+        # Simulate each swap: in-range liquidity uses exact int math per event
+        for i, (block_number, sqrt_price_x96) in enumerate(
+            zip(swaps["block"], swaps["sqrt_price_x96"])
+        ):
             positions = get_deployed_positions(block_number)
             total_in_range_liq = 0
-            for position in positions:
-                # Convert tick bounds to prices
-                sqrt_price_lower_x96 = UniswapV3Math.get_sqrt_ratio_at_tick(
-                    position.tick_lower
-                )
-                sqrt_price_upper_x96 = UniswapV3Math.get_sqrt_ratio_at_tick(
-                    position.tick_upper
-                )
-
+            for (
+                sqrt_price_lower_x96,
+                sqrt_price_upper_x96,
+                allocation0,
+                allocation1,
+            ) in positions:
                 # Check if position is in range
                 if sqrt_price_lower_x96 <= sqrt_price_x96 <= sqrt_price_upper_x96:
                     in_range_count += 1
-                    # Calculate position liquidity AND actual amounts deployed
-                    # In V3, you can't always deploy all tokens - only what fits the limiting token
-                    (
-                        position_liquidity,
-                        amount0_deployed,
-                        amount1_deployed,
-                    ) = UniswapV3Math.position_liquidity_and_used_amounts(
-                        position.tick_lower,
-                        position.tick_upper,
+                    # Only the liquidity matters for the fee share; the amounts
+                    # actually deployed are computed once at the end
+                    total_in_range_liq += UniswapV3Math.get_liquidity_for_amounts(
                         sqrt_price_x96,
-                        int(position.allocation0),
-                        int(position.allocation1),
+                        sqrt_price_lower_x96,
+                        sqrt_price_upper_x96,
+                        allocation0,
+                        allocation1,
                     )
-                    total_in_range_liq += position_liquidity
-
-            # Get swap amounts (signed: positive = token came IN, negative = token went OUT)
-            # In Uniswap V3, fees are ONLY charged on the INPUT token
-            raw_amount0 = float(event.get("amount0", 0) or 0)
-            raw_amount1 = float(event.get("amount1", 0) or 0)
+            in_range_liquidity[i] = total_in_range_liq
 
-            # Calculate liquidity share for this swap
-            liquidity_share = self._calculate_liquidity_share(
-                total_in_range_liq,
-                event,
+        # Swaps with no simulated liquidity in range earn nothing, so shares and
+        # fees are only computed for the rest
+        earning = in_range_liquidity > 0
+        total_fees0 = 0.0
+        total_fees1 = 0.0
+        if earning.any():
+            # Calculate liquidity share for every earning swap at once
+            liquidity_share = self._calculate_liquidity_shares(
+                in_range_liquidity[earning], swaps["liquidity"][earning]
             )
 
-            # Fees earned ONLY on the input token (the one with positive amount)
+            # In Uniswap V3, fees are ONLY charged on the INPUT token (positive amount)
             # If amount0 > 0: user swapped token0 for token1, fee is on token0
             # If amount1 > 0: user swapped token1 for token0, fee is on token1
-            if raw_amount0 > 0:
-                total_fees0 += int(raw_amount0 * fee_rate * liquidity_share)
-            elif raw_amount1 > 0:
-                total_fees1 += int(raw_amount1 * fee_rate * liquidity_share)
-
-        final_sqrt_price_x96 = await self.db.get_sqrt_price_at_block(
-            pair_address, end_block
-        )
-        initial_sqrt_price_x96 = await self.db.get_sqrt_price_at_block(
-            pair_address, start_block
-        )
+            # Boolean indexing copies, so the fees are computed in place
+            fees0 = swaps["amount0"][earning]
+            fees1 = swaps["amount1"][earning]
+            token0_in = fees0 > 0
+            token1_in = ~token0_in & (fees1 > 0)
+            for fees in (fees0, fees1):
+                np.multiply(fees, fee_rate, out=fees)
+                np.multiply(fees, liquidity_share, out=fees)
+                np.trunc(fees, out=fees)
+            total_fees0 = float(fees0.sum(where=token0_in))
+            total_fees1 = float(fees1.sum(where=token1_in))
 
         # price in Q192 (token1/token0)
         final_price_x192 = (
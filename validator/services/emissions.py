@@ -2,6 +2,7 @@ import logging
 import asyncio
 from typing import Dict, List, Tuple, Optional
 import bittensor as bt
+import numpy as np
 from decimal import Decimal
 
 from validator.services.price import PriceService
@@ -156,51 +157,37 @@ class EmissionsService:
             (uids, weights) - Lists of UIDs and their corresponding weights
         """
         uids = self.metagraph.uids.tolist()
-        weights = [0.0] * len(uids)
+        weights = np.zeros(len(uids), dtype=np.float64)
+        uid_index = {uid: i for i, uid in enumerate(uids)}
         
         # 1. Calculate Burn Split
         burn_ratio, miner_ratio = await self.calculate_emissions_split()
         
         # 2. Assign Burn Weight to UID 0
         # UID 0 receives burn_ratio proportion of total emissions
-        uid_0_index = None
-        for i, uid in enumerate(uids):
-            if uid == 0:
-                uid_0_index = i
-                weights[i] = burn_ratio
-                break
-        
-        if uid_0_index is None:
+        uid_0_index = uid_index.get(0)
+        if uid_0_index is not None:
+            weights[uid_0_index] = burn_ratio
+        else:
             logger.warning("UID 0 not found in metagraph, cannot assign burn weight")
         
         # 3. Distribute Miner Ratio among top miners based on scores
         if miner_ratio > 0 and miner_scores:
-            # Sort miners by score (descending) to get top miners
-            sorted_miners = sorted(
-                miner_scores.items(), key=lambda x: x[1], reverse=True
+            # UID 0 is reserved for burn
+            miner_uids = [uid for uid in miner_scores if uid != 0]
+            scores = np.array(
+                [float(miner_scores[uid]) for uid in miner_uids], dtype=np.float64
             )
             
             # Calculate total score for normalization
-            total_score = sum(score for uid, score in sorted_miners if uid != 0)
+            total_score = scores.sum()
             
             if total_score > 0:
-                # Distribute miner_ratio proportionally to top miners
-                for uid, score in sorted_miners:
-                    if uid == 0:
-                        continue  # UID 0 is reserved for burn
-                    
-                    # Find UID index in metagraph
-                    uid_index = None
-                    for i, metagraph_uid in enumerate(uids):
-                        if metagraph_uid == uid:
-                            uid_index = i
-                            break
-                    
-                    if uid_index is not None:
-                        # Normalize score contribution
-                        normalized_score = score / total_score
-                        # Assign weight proportional to score
-                        weights[uid_index] = normalized_score * miner_ratio
+                # Distribute miner_ratio proportionally to miners present in the metagraph
+                present = [k for k, uid in enumerate(miner_uids) if uid in uid_index]
+                if present:
+                    idx = np.array([uid_index[miner_uids[k]] for k in present])
+                    weights[idx] = scores[present] / total_score * miner_ratio
             else:
                 logger.warning("Total miner score is 0, all miner emissions go to burn")
                 # If no scores, add remaining ratio to burn
@@ -213,28 +200,25 @@ class EmissionsService:
                 weights[uid_0_index] = burn_ratio + miner_ratio
         
         # Normalize weights to sum to 1.0 (Bittensor requirement)
-        total_weight = sum(weights)
+        total_weight = weights.sum()
         if total_weight > 0:
-            weights = [w / total_weight for w in weights]
+            weights /= total_weight
         else:
             # Fallback: if all weights are 0, assign 100% to UID 0
             logger.warning("All weights are 0, defaulting to 100% burn")
             if uid_0_index is not None:
                 weights[uid_0_index] = 1.0
         
-        burn_weight = weights[uid_0_index] if uid_0_index is not None else 0.0
-        miner_total = sum(
-            w for i, w in enumerate(weights)
-            if uid_0_index is None or i != uid_0_index
-        )
-        total_weight = sum(weights)
+        total_weight = float(weights.sum())
+        burn_weight = float(weights[uid_0_index]) if uid_0_index is not None else 0.0
+        miner_total = total_weight - burn_weight
         
         logger.info(
             f"Weight distribution: Burn (UID 0)={burn_weight:.4f}, "
             f"Miner total={miner_total:.4f}, Total={total_weight:.4f}"
         )
         
-        return uids, weights
+        return uids, weights.tolist()
 
     async def get_miner_aggregate_scores(self) -> Dict[int, float]:
         """
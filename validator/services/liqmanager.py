@@ -122,6 +122,53 @@ class SnLiqManagerService:
             )
             return 0
 
+    async def _read_position(
+        self,
+        nft_manager_contract: AsyncContract,
+        token_id: int,
+        current_sqrt_price_x96: int,
+    ) -> Optional[Position]:
+        """
+        Read one NFT position and convert its liquidity to token amounts.
+
+        Returns:
+            The position, or None if it could not be read
+        """
+        try:
+            position_info = await nft_manager_contract.functions.positions(
+                token_id
+            ).call()
+
+            # Position info: (nonce, operator, token0, token1, tickSpacing,
+            #                 tickLower, tickUpper, liquidity, ...)
+            tick_lower = position_info[5]
+            tick_upper = position_info[6]
+            liquidity = position_info[7]
+
+            logger.debug(
+                f"Position {token_id}: ticks [{tick_lower}, {tick_upper}], "
+                f"liquidity {liquidity}"
+            )
+
+            # Convert liquidity to actual amounts based on current price
+            amount0, amount1 = UniswapV3Math.get_amounts_for_liquidity(
+                current_sqrt_price_x96,
+                UniswapV3Math.get_sqrt_ratio_at_tick(tick_lower),
+                UniswapV3Math.get_sqrt_ratio_at_tick(tick_upper),
+                liquidity,
+            )
+
+            # On-chain ticks/amounts are already ints; skip re-validation.
+            return Position.model_construct(
+                tick_lower=tick_lower,
+                tick_upper=tick_upper,
+                allocation0=str(amount0),
+                allocation1=str(amount1),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to read position {token_id}: {e}")
+            return None
+
     async def get_inventory(self) -> Inventory:
         """
         Get inventory from LiquidityManager contract.
@@ -171,7 +218,8 @@ class SnLiqManagerService:
             self._get_stashed_tokens(ak_address, token1),
         )
 
-        inventory = Inventory(amount0=str(amount0), amount1=str(amount1))
+        # Balances come straight from the contract as ints; skip re-validation.
+        inventory = Inventory.model_construct(amount0=str(amount0), amount1=str(amount1))
 
         logger.info(
             f"Retrieved inventory for pair {self.pool.address}: "
@@ -252,42 +300,13 @@ class SnLiqManagerService:
             addr=nft_manager_address,
         )
 
-        positions = []
-        for token_id in token_ids:
-            try:
-                position_info = await nft_manager_contract.functions.positions(
-                    token_id
-                ).call()
-
-                # Position info: (nonce, operator, token0, token1, tickSpacing,
-                #                 tickLower, tickUpper, liquidity, ...)
-                tick_lower = position_info[5]
-                tick_upper = position_info[6]
-                liquidity = position_info[7]
-
-                logger.debug(
-                    f"Position {token_id}: ticks [{tick_lower}, {tick_upper}], "
-                    f"liquidity {liquidity}"
-                )
-
-                # Convert liquidity to actual amounts based on current price
-                amount0, amount1 = UniswapV3Math.get_amounts_for_liquidity(
-                    current_sqrt_price_x96,
-                    UniswapV3Math.get_sqrt_ratio_at_tick(tick_lower),
-                    UniswapV3Math.get_sqrt_ratio_at_tick(tick_upper),
-                    liquidity,
-                )
-
-                positions.append(
-                    Position(
-                        tick_lower=tick_lower,
-                        tick_upper=tick_upper,
-                        allocation0=str(amount0),
-                        allocation1=str(amount1),
-                    )
-                )
-            except Exception as e:
-                logger.warning(f"Failed to read position {token_id}: {e}")
-                continue
+        # Read every position concurrently instead of one round trip at a time
+        results = await asyncio.gather(
+            *(
+                self._read_position(nft_manager_contract, token_id, current_sqrt_price_x96)
+                for token_id in token_ids
+            )
+        )
+        positions = [p for p in results if p is not None]
 
         return positions
@@ -1,13 +1,23 @@
+import asyncio
 import functools
 import time
 from typing import Dict
 
 
 def async_ttl_cache(ttl: float = 2.0):
-    """Cache async function results for *ttl* seconds, keyed by arguments."""
+    """
+    Cache async function results for *ttl* seconds, keyed by arguments.
+
+    Concurrent misses for the same key share one in-flight call instead of
+    each hitting the backend. Exceptions are propagated and not cached, and
+    expired entries are evicted whenever a new result is stored.
+    """
 
     def decorator(fn):
         _cache: Dict[tuple, tuple] = {}
+        _inflight: Dict[tuple, asyncio.Task] = {}
+        # Bumped by cache_clear so calls started before it cannot repopulate the cache
+        _generation = 0
 
         def _make_key(args, kwargs):
             parts = []
@@ -25,6 +35,14 @@ def async_ttl_cache(ttl: float = 2.0):
                     parts.append((k, id(v)))
             return tuple(parts)
 
+        def _evict_expired():
+            # Keys can be one-off (e.g. block numbers): drop stale entries on
+            # insert so they cannot pile up in a long-running process.
+            now = time.monotonic()
+            expired = [k for k, (cached_at, _) in _cache.items() if now - cached_at >= ttl]
+            for k in expired:
+                del _cache[k]
+
         @functools.wraps(fn)
         async def wrapper(*args, **kwargs):
             key = _make_key(args, kwargs)
@@ -33,11 +51,33 @@ def async_ttl_cache(ttl: float = 2.0):
                 cached_at, result = _cache[key]
                 if now - cached_at < ttl:
                     return result
-            result = await fn(*args, **kwargs)
-            _cache[key] = (now, result)
-            return result
+            task = _inflight.get(key)
+            if task is None:
+                task = asyncio.ensure_future(fn(*args, **kwargs))
+                _inflight[key] = task
+                generation = _generation
+
+                def _done(t: asyncio.Task) -> None:
+                    if _inflight.get(key) is t:
+                        _inflight.pop(key)
+                    if t.cancelled() or t.exception() is not None:
+                        return
+                    if generation == _generation:
+                        _evict_expired()
+                        _cache[key] = (now, t.result())
+
+                task.add_done_callback(_done)
+            # Shield so one cancelled caller does not cancel the shared call.
+            return await asyncio.shield(task)
+
+        def cache_clear():
+            nonlocal _generation
+            _generation += 1
+            _cache.clear()
+            _inflight.clear()
 
-        wrapper.cache_clear = lambda: _cache.clear()
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_len = lambda: len(_cache)
         return wrapper
 
     return decorator
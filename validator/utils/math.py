@@ -1,6 +1,10 @@
 import math
+from functools import lru_cache
 from typing import Tuple
 
+# ln(1.0001): one tick is a 0.01% price move
+_LOG_1_0001 = math.log(1.0001)
+
 
 class UniswapV3Math:
     """
@@ -35,6 +39,7 @@ class UniswapV3Math:
         return price
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def get_sqrt_ratio_at_tick(tick: int) -> int:
         if tick < UniswapV3Math.MIN_TICK or tick > UniswapV3Math.MAX_TICK:
             raise ValueError("T")
@@ -100,7 +105,7 @@ class UniswapV3Math:
         if sqrt_price_x96 <= 0:
             return 0
         sqrt_price = float(sqrt_price_x96) / UniswapV3Math.Q96
-        tick = 2 * math.log(sqrt_price) / math.log(1.0001)
+        tick = 2 * math.log(sqrt_price) / _LOG_1_0001
         return int(tick)
 
     # -----------------------------
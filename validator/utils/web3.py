@@ -1,7 +1,8 @@
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 import web3
 from web3 import AsyncHTTPProvider, AsyncWeb3, Web3
@@ -25,12 +26,26 @@ CHAIN_ID_TO_RPC = {
 _web3_cache: Dict[int, "AsyncWeb3Helper"] = {}
 
 
+@lru_cache(maxsize=None)
+def _load_abi(path: Path) -> Any:
+    if not path.is_file():
+        raise ValueError(f"Invalid ABI file path {path}")
+
+    with open(path, "r") as f:
+        abi_data = json.load(f)
+        if isinstance(abi_data, dict):
+            return abi_data.get("abi", abi_data)
+        return abi_data
+
+
 class AsyncWeb3Helper:
     """Class acting as web3 base class"""
 
     def __init__(self) -> None:
         """Initialize web3 helper"""
         self.web3: Optional[AsyncWeb3] = None
+        # (abi name, checksum address) -> contract; instances are per chain via make_web3
+        self._contracts: Dict[Tuple[str, str], AsyncContract] = {}
 
     @classmethod
     def make_web3(cls, chain_id: int) -> "AsyncWeb3Helper":
@@ -45,15 +60,8 @@ class AsyncWeb3Helper:
         return instance
 
     def load_abi(self, path: Path) -> Dict[str, Any]:
-        """Load an ABI file"""
-        if not path.is_file():
-            raise ValueError(f"Invalid ABI file path {path}")
-
-        with open(path, "r") as f:
-            abi_data = json.load(f)
-            if isinstance(abi_data, dict):
-                return abi_data.get("abi", abi_data)
-            return abi_data
+        """Load an ABI file (parsed once per path)"""
+        return _load_abi(path)
 
     def make_contract(self, abi_path: Path, addr: str) -> AsyncContract:
         """Make a contract object"""
@@ -64,7 +72,11 @@ class AsyncWeb3Helper:
         return contract
 
     def make_contract_by_name(self, name: str, addr: str) -> AsyncContract:
-        """Make a contract object"""
-        abi_path = DEFAULT_ABI_PATH / f"{name}.json"
-        contract = self.make_contract(abi_path, addr)
+        """Make a contract object, reusing the one already built for (name, addr)"""
+        key = (name, Web3.to_checksum_address(addr))
+        contract = self._contracts.get(key)
+        if contract is None:
+            abi_path = DEFAULT_ABI_PATH / f"{name}.json"
+            contract = self.make_contract(abi_path, addr)
+            self._contracts[key] = contract
         return contract
\ No newline at end of file
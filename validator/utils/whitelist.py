@@ -1,12 +1,63 @@
 import json
 import logging
 import os
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple, TypeVar
 
 logger = logging.getLogger(__name__)
 
 WHITELIST_FILE = "miner_whitelist.json"
 
+T = TypeVar("T")
+
+
+@lru_cache(maxsize=4)
+def _load_whitelist(path: str, mtime_ns: int, size: int) -> Tuple[Dict[str, str], ...]:
+    """
+    Parse the whitelist file once per (path, mtime, size).
+
+    The mtime and size are part of the cache key so edits to the file are
+    picked up on the next lookup without restarting the validator. Read and
+    parse errors raise, so a read that catches the file mid-rewrite is never
+    cached.
+    """
+    with open(path, "r") as f:
+        whitelist = json.load(f)
+    if not isinstance(whitelist, list):
+        raise ValueError("must contain a list")
+    return tuple(whitelist)
+
+
+@lru_cache(maxsize=4)
+def _load_hotkey_set(path: str, mtime_ns: int, size: int) -> FrozenSet[str]:
+    """Hotkey lookup table built once per parsed whitelist."""
+    return frozenset(
+        item.get("hotkey")
+        for item in _load_whitelist(path, mtime_ns, size)
+        if isinstance(item, dict) and item.get("hotkey")
+    )
+
+
+def _read_cached(loader: Callable[[str, int, int], T], default: T) -> T:
+    """Run a cached loader on WHITELIST_FILE, returning ``default`` if it can't be read."""
+    try:
+        stat = os.stat(WHITELIST_FILE)
+    except OSError:
+        return default
+
+    try:
+        return loader(WHITELIST_FILE, stat.st_mtime_ns, stat.st_size)
+    except json.JSONDecodeError:
+        logger.error(f"Failed to parse whitelist file {WHITELIST_FILE}")
+    except Exception as e:
+        logger.error(f"Error reading whitelist file {WHITELIST_FILE}: {e}")
+    return default
+
+
+def _whitelisted_hotkeys() -> FrozenSet[str]:
+    return _read_cached(_load_hotkey_set, frozenset())
+
+
 def get_whitelisted_miners() -> List[Dict[str, str]]:
     """
     Read the whitelist file and return list of whitelisted miner entries.
@@ -15,22 +66,11 @@ def get_whitelisted_miners() -> List[Dict[str, str]]:
         List of dicts with 'name' and 'hotkey' keys.
         Returns empty list if file doesn't exist or is invalid.
     """
-    if not os.path.exists(WHITELIST_FILE):
-        return []
-        
-    try:
-        with open(WHITELIST_FILE, "r") as f:
-            whitelist = json.load(f)
-            if not isinstance(whitelist, list):
-                logger.warning(f"Whitelist file {WHITELIST_FILE} must contain a list")
-                return []
-            return whitelist
-    except json.JSONDecodeError:
-        logger.error(f"Failed to parse whitelist file {WHITELIST_FILE}")
-        return []
-    except Exception as e:
-        logger.error(f"Error reading whitelist file {WHITELIST_FILE}: {e}")
-        return []
+    # Copy the entries: the parsed tuple is cached and shared by every caller
+    return [
+        dict(item) if isinstance(item, dict) else item
+        for item in _read_cached(_load_whitelist, ())
+    ]
 
 def is_miner_whitelisted(hotkey: str) -> bool:
     """
@@ -44,10 +84,22 @@ def is_miner_whitelisted(hotkey: str) -> bool:
     """
     if not hotkey:
         return False
-        
-    whitelist = get_whitelisted_miners()
-    for item in whitelist:
-        if item.get("hotkey") == hotkey:
-            return True
-            
-    return False
+
+    return hotkey in _whitelisted_hotkeys()
+
+
+def are_miners_whitelisted(hotkeys: List[str]) -> List[bool]:
+    """
+    Check a batch of hotkeys against the whitelist.
+
+    Loads the whitelist once for the whole batch, which is cheaper than
+    calling is_miner_whitelisted() per metagraph entry.
+
+    Args:
+        hotkeys: Miner hotkey addresses (e.g. metagraph.hotkeys)
+
+    Returns:
+        List of booleans aligned with ``hotkeys``
+    """
+    whitelisted = _whitelisted_hotkeys()
+    return [bool(hotkey) and hotkey in whitelisted for hotkey in hotkeys]
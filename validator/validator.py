@@ -177,23 +177,18 @@ async def run_jobs_validator(config):
         wallet_kwargs["path"] = config["wallet_path"]
     wallet = bt.Wallet(**wallet_kwargs)
     subtensor = bt.Subtensor(network=config["subtensor_network"])
+    # Subtensor.metagraph() syncs from chain through this same connection, so no
+    # extra metagraph.sync() round trip is needed.
     metagraph = subtensor.metagraph(netuid=config["netuid"])
-    # Force sync from chain (Bittensor may otherwise serve cached metagraph from disk)
-    if hasattr(metagraph, "sync"):
-        try:
-            metagraph.sync()
-            logger.info("Metagraph synced from chain at startup.")
-        except Exception as e:
-            logger.warning("Metagraph sync at startup failed (using loaded state): %s", e)
+    logger.info("Metagraph synced from chain at startup.")
     dendrite = bt.Dendrite(wallet=wallet)
 
     # Find validator's own UID (exclude from miner queries to avoid self-query)
     my_hotkey = wallet.hotkey.ss58_address
-    my_uid = None
-    for uid in range(len(metagraph.hotkeys)):
-        if metagraph.hotkeys[uid] == my_hotkey:
-            my_uid = uid
-            break
+    try:
+        my_uid = metagraph.hotkeys.index(my_hotkey)
+    except ValueError:
+        my_uid = None
     # Exit the process when the hotkey is not registered
     if my_uid is None:
         logger.error(f"Hotkey {my_hotkey} is not registered on netuid {config['netuid']} (network: {config['subtensor_network']})")
@@ -250,10 +245,8 @@ async def run_jobs_validator(config):
     # Track running jobs and their tasks
     running_jobs = {}  # job_id -> task
 
-    # Snapshot of uid -> hotkey for detecting replacements (resync metagraph when changed)
-    last_hotkeys: dict[int, str] = {
-        uid: metagraph.hotkeys[uid] for uid in range(len(metagraph.hotkeys))
-    }
+    # Snapshot of hotkeys indexed by uid for detecting replacements (resync metagraph when changed)
+    last_hotkeys: list[str] = list(metagraph.hotkeys)
 
     logger.info("=" * 80)
     logger.info("Starting continuous job execution with dynamic job discovery...")
@@ -330,17 +323,14 @@ async def run_jobs_validator(config):
                 # Resync metagraph; if any uid has a different hotkey (replacement), zero out that miner
                 logger.debug("Metagraph resync: fetching latest...")
                 metagraph_new = subtensor.metagraph(netuid=config["netuid"])
-                if hasattr(metagraph_new, "sync"):
-                    try:
-                        metagraph_new.sync()
-                    except Exception as e:
-                        logger.debug("Metagraph sync in loop failed: %s", e)
-                replaced_uids = []
-                for uid in range(len(metagraph_new.hotkeys)):
-                    prev = last_hotkeys.get(uid)
-                    new_hk = metagraph_new.hotkeys[uid]
-                    if prev is not None and prev != new_hk:
-                        replaced_uids.append((uid, prev, new_hk))
+                # zip() stops at the shorter list, so newly added uids are not "replaced"
+                replaced_uids = [
+                    (uid, prev, new_hk)
+                    for uid, (prev, new_hk) in enumerate(
+                        zip(last_hotkeys, metagraph_new.hotkeys)
+                    )
+                    if prev != new_hk
+                ]
                 if replaced_uids:
                     for uid, _prev_hk, _new_hk in replaced_uids:
                         await job_repository.zero_out_miner(uid)
@@ -350,8 +340,7 @@ async def run_jobs_validator(config):
                 else:
                     logger.info("Metagraph resync: no hotkey changes.")
                 # Update snapshot and shared metagraph reference
-                for uid in range(len(metagraph_new.hotkeys)):
-                    last_hotkeys[uid] = metagraph_new.hotkeys[uid]
+                last_hotkeys[:] = metagraph_new.hotkeys
                 orchestrator.metagraph = metagraph_new
                 emissions_service.metagraph = metagraph_new
 